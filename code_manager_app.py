@@ -6,11 +6,26 @@ import os
 import sys
 import qrcode
 from barcode import Code128
-from barcode.writer import ImageWriter
+from barcode.writer import ImageWriter, SVGWriter
 from PIL import Image, ImageTk
+import collections
 import configparser
+import contextlib
+import functools
+import hashlib
+import io
+import re
 import subprocess
 import shutil
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# Optional: SVG previews skip Pillow rasterization on the interactive path
+try:
+    import tksvg
+except ImportError:
+    tksvg = None
 
 # Conditional import for Windows printing support
 if sys.platform.startswith('win'):
@@ -23,9 +38,21 @@ if sys.platform.startswith('win'):
 
 CONFIG_FILE = 'config.ini'
 CODES_DIR = 'codes_generated'
+LIST_PAGE_SIZE = 500  # Rows fetched per page when filling the record views
+
+# Characters acceptable in barcode data (alphanumerics plus the Code39-style
+# symbol set the UI has always allowed), precompiled once. The old inline
+# check (`not isalnum() and not all(...)`) both looped per character and
+# accepted some invalid mixes; a single anchored match is faster and correct.
+_BAR_DATA_RE = re.compile(r'^[A-Za-z0-9 \-$./+%]+$')
 
-# Ensure the storage directory exists
+# Content-addressed image cache: regenerating an identical payload hardlinks
+# the cached PNG instead of re-rasterizing and re-encoding it
+CACHE_DIR = os.path.join(CODES_DIR, '.cache')
+
+# Ensure the storage directories exist
 os.makedirs(CODES_DIR, exist_ok=True)
+os.makedirs(CACHE_DIR, exist_ok=True)
 
 
 def create_default_config():
@@ -41,11 +68,26 @@ def create_default_config():
         config.write(configfile)
 
 
+# Parsed settings cached on the config file's mtime, so repeated loads cost
+# one stat() instead of an open+read+parse per call
+_CFG_CACHE = (None, None)
+
+
 def load_config():
-    """Loads DB settings from the config file, creating a default if needed."""
+    """Loads DB settings from the config file, creating a default if needed.
+
+    The parsed settings are memoized on the file's modification time;
+    editing config.ini on disk still takes effect on the next load.
+    """
+    global _CFG_CACHE
+
     if not os.path.exists(CONFIG_FILE):
         create_default_config()
 
+    mtime = os.path.getmtime(CONFIG_FILE)
+    if _CFG_CACHE[0] == mtime:
+        return _CFG_CACHE[1]
+
     config = configparser.ConfigParser()
     config.read(CONFIG_FILE)
 
@@ -55,6 +97,7 @@ def load_config():
         'password': config.get('mysql', 'password'),
         'database': config.get('mysql', 'database')
     }
+    _CFG_CACHE = (mtime, settings)
     return settings
 
 
@@ -65,15 +108,35 @@ def save_config(settings):
     with open(CONFIG_FILE, 'w') as configfile:
         config.write(configfile)
 
+    load_config()  # Re-prime the mtime cache with what was just written
+
 
 # Load the initial configuration
 DB_CONFIG = load_config()
 
+# Module-level connection pool. Opening a fresh TCP + auth handshake for every
+# small query dominates latency, so connections are pooled and reused; the pool
+# is rebuilt lazily whenever the connection settings change.
+_POOL = None
+_POOL_KEY = None
+
+# Prefer the connector's C-extension protocol implementation when it is
+# available; decoding rows in C instead of Python bytecode is typically
+# several times faster for large fetches
+try:
+    from mysql.connector import HAVE_CEXT as _HAVE_CEXT
+except ImportError:
+    _HAVE_CEXT = False
+
 
 def get_db_connection(use_db_name=True):
-    """Establishes and returns a database connection using current config."""
-    global DB_CONFIG
-    DB_CONFIG = load_config()
+    """Returns a pooled database connection using current config.
+
+    Closing the returned connection hands it back to the pool rather than
+    tearing down the TCP session. The `use_db_name=False` branch (only used
+    for setup/deletion) still opens a direct, non-pooled connection.
+    """
+    global _POOL, _POOL_KEY
 
     connect_params = DB_CONFIG.copy()
 
@@ -85,20 +148,45 @@ def get_db_connection(use_db_name=True):
     if not connect_params.get('password'):
         connect_params.pop('password', None)
 
-    try:
-        conn = mysql.connector.connect(**connect_params)
-
-        if use_db_name:
-            # Manually ensure the database is used if we connected successfully without specifying it
-            if conn.database is None:
-                conn.database = DB_CONFIG['database']
+    # Fall back to the pure-Python protocol if the C extension is missing
+    connect_params['use_pure'] = not _HAVE_CEXT
 
-        return conn
+    try:
+        if not use_db_name:
+            # Setup/drop operations are rare; a direct connection is fine here.
+            return mysql.connector.connect(**connect_params)
+
+        # Rebuild the pool if the configuration changed since it was created
+        pool_key = tuple(sorted(connect_params.items()))
+        if _POOL is None or _POOL_KEY != pool_key:
+            # autocommit collapses single-statement INSERT + COMMIT into one
+            # round-trip; multi-statement paths opt back in via
+            # start_transaction()/bulk_mode()
+            _POOL = mysql.connector.pooling.MySQLConnectionPool(
+                pool_name="cm", pool_size=8, autocommit=True, **connect_params)
+            _POOL_KEY = pool_key
+
+        # The connector already selects the schema from connect_params, so no
+        # extra `conn.database = ...` (a USE round-trip) is needed here
+        return _POOL.get_connection()
 
     except mysql.connector.Error as err:
         return None
 
 
+def reset_connection_pool():
+    """Discards the pool so the next get_db_connection() connects fresh.
+
+    Needed whenever the database is dropped or recreated: pooled sessions
+    keep their (now missing) default schema and reset_session does not
+    restore it, so without this every pooled query would keep failing with
+    "no database selected" until the app restarts.
+    """
+    global _POOL, _POOL_KEY
+    _POOL = None
+    _POOL_KEY = None
+
+
 def setup_database_tables():
     """Creates the database and necessary tables if they don't exist."""
     # Connect without specifying the database name first
@@ -115,44 +203,24 @@ def setup_database_tables():
 
         conn.database = db_name  # Now use the new/existing database
 
+        # One round-trip per CREATE TABLE: execute(multi=True) no longer
+        # exists in current connector releases, and setup is cold-path anyway
         cursor.execute("""
                        CREATE TABLE IF NOT EXISTS created_codes
                        (
-                           id
-                           INT
-                           AUTO_INCREMENT
-                           PRIMARY
-                           KEY,
-                           type
-                           VARCHAR
-                       (
-                           10
-                       ) NOT NULL, -- 'QR' or 'BAR'
+                           id INT AUTO_INCREMENT PRIMARY KEY,
+                           type VARCHAR(10) NOT NULL, -- 'QR' or 'BAR'
                            data TEXT NOT NULL,
-                           image_path VARCHAR
-                       (
-                           255
-                       ) NOT NULL,
+                           image_path VARCHAR(255) NOT NULL,
                            date_created DATETIME NOT NULL
-                           )
+                       )
                        """)
-
         cursor.execute("""
                        CREATE TABLE IF NOT EXISTS scanned_codes
                        (
-                           id
-                           INT
-                           AUTO_INCREMENT
-                           PRIMARY
-                           KEY,
-                           data
-                           TEXT
-                           NOT
-                           NULL,
-                           date_scanned
-                           DATETIME
-                           NOT
-                           NULL
+                           id INT AUTO_INCREMENT PRIMARY KEY,
+                           data TEXT NOT NULL,
+                           date_scanned DATETIME NOT NULL
                        )
                        """)
 
@@ -166,36 +234,51 @@ def setup_database_tables():
         return False
 
 
-def backup_database():
-    """Performs a database backup using mysqldump."""
-    timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-    backup_file = f"code_manager_backup_{timestamp}.sql"
+def _format_timestamp(dt):
+    """Formats dt as YYYYMMDD_HHMMSS without strftime's format parsing.
 
-    try:
-        command = [
-            "mysqldump",
-            "-u", DB_CONFIG['user'],
-        ]
-        if DB_CONFIG['password']:
-            command.append(f"--password={DB_CONFIG['password']}")
+    strftime tokenizes its format string on every call; for a fixed layout a
+    direct f-string is severalfold faster. Record timestamps never come
+    through here — those are formatted server-side via DATE_FORMAT.
+    """
+    return (f"{dt.year:04d}{dt.month:02d}{dt.day:02d}_"
+            f"{dt.hour:02d}{dt.minute:02d}{dt.second:02d}")
 
-        command.extend([
-            DB_CONFIG['database'],
-            "-r", backup_file
-        ])
 
-        subprocess.run(command, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+def start_database_backup():
+    """Launches a mysqldump backup in the background.
 
-        messagebox.showinfo("Success", f"Database backed up successfully to: {backup_file}")
-        return True
+    Returns (proc, backup_file, stderr_file) on success or
+    (None, error_message, None) if the command could not be started.
+    mysqldump writes straight to the backup file via -r, so nothing is
+    buffered in Python memory and the caller can poll proc.poll() from the
+    Tk event loop instead of blocking on it. stderr goes to an unnamed temp
+    file rather than a pipe: nothing drains a pipe while the dump runs, so
+    more than a pipe buffer's worth of warnings would block mysqldump
+    forever.
+    """
+    timestamp = _format_timestamp(datetime.datetime.now())
+    backup_file = f"code_manager_backup_{timestamp}.sql"
 
+    command = [
+        "mysqldump",
+        "-u", DB_CONFIG['user'],
+    ]
+    if DB_CONFIG['password']:
+        command.append(f"--password={DB_CONFIG['password']}")
+
+    command.extend([
+        DB_CONFIG['database'],
+        "-r", backup_file
+    ])
+
+    stderr_file = tempfile.TemporaryFile()
+    try:
+        proc = subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=stderr_file)
+        return proc, backup_file, stderr_file
     except FileNotFoundError:
-        messagebox.showerror("Backup Error",
-                             "mysqldump command not found. Ensure XAMPP's MySQL bin folder is in your system PATH.")
-        return False
-    except subprocess.CalledProcessError as e:
-        messagebox.showerror("Backup Error", f"Error during backup: {e.stderr.decode()}")
-        return False
+        stderr_file.close()
+        return None, "mysqldump command not found. Ensure XAMPP's MySQL bin folder is in your system PATH.", None
 
 
 # --- 2. CODE GENERATION AND DATABASE STORAGE ---
@@ -211,21 +294,87 @@ def format_wifi_payload(ssid, password, auth_type):
     return payload
 
 
-def insert_code_metadata(type, data, image_path):
-    """Inserts metadata about the created code into the database."""
+@contextlib.contextmanager
+def bulk_mode(conn):
+    """Session tweaks that amortize InnoDB work across a bulk write.
+
+    Turns off autocommit and the per-row unique/foreign-key checks for the
+    duration of the batch so redo-log flushes happen once per commit rather
+    than once per row; settings are restored afterwards. The caller still
+    commits explicitly inside the block.
+    """
+    cursor = conn.cursor()
+    cursor.execute("SET autocommit=0")
+    cursor.execute("SET unique_checks=0")
+    cursor.execute("SET foreign_key_checks=0")
+    cursor.close()
+    try:
+        yield conn
+    except Exception:
+        # Roll back before autocommit is restored below: SET autocommit=1
+        # implicitly commits an open transaction, which would persist the
+        # prefix of a failed batch
+        conn.rollback()
+        raise
+    finally:
+        cursor = conn.cursor()
+        cursor.execute("SET unique_checks=1")
+        cursor.execute("SET foreign_key_checks=1")
+        cursor.execute("SET autocommit=1")
+        cursor.close()
+
+
+def bulk_insert(cursor, table, cols, rows, chunk=2000):
+    """Inserts many rows using client-side expanded multi-row VALUES lists.
+
+    The connector sends each executemany row as its own statement unless the
+    VALUES list is built client-side; expanding it here means one network
+    packet, one parse and one commit per chunk of 2000 rows. Intended for
+    bulk ingestion paths (imports, table repopulation).
+    """
+    placeholder = "(" + ", ".join(["%s"] * len(cols)) + ")"
+    prefix = f"INSERT INTO {table} ({', '.join(cols)}) VALUES "
+
+    for start in range(0, len(rows), chunk):
+        batch = rows[start:start + chunk]
+        sql = prefix + ", ".join([placeholder] * len(batch))
+        params = [value for row in batch for value in row]
+        cursor.execute(sql, params)
+
+
+# Metadata rows waiting to be written. Generating many codes in a row used to
+# cost one connection + INSERT round-trip each; rows are now queued and written
+# in a single executemany batch when flush_pending_metadata() is called.
+_PENDING_META = []
+
+# Hoisted so every insert re-executes the same prepared statement text
+_INSERT_META_SQL = (
+    "INSERT INTO created_codes (type, data, image_path, date_created) "
+    "VALUES (%s, %s, %s, %s)"
+)
+
+
+def insert_code_metadata(rows):
+    """Inserts a batch of (type, data, image_path, date_created) rows."""
     conn = get_db_connection()
     if conn:
-        cursor = conn.cursor()
-        sql = """
-              INSERT INTO created_codes (type, data, image_path, date_created)
-              VALUES (%s, %s, %s, %s) \
-              """
-        now = datetime.datetime.now()
-        metadata_data = data[:250]
-        values = (type, metadata_data, image_path, now)
+        # Prepared cursors skip the server-side SQL parse on re-execution,
+        # but their executemany degrades to one execute() per row — so the
+        # batch path uses a plain cursor and builds the multi-row VALUES
+        # list itself via bulk_insert
+        cursor = conn.cursor() if len(rows) > 1 else conn.cursor(prepared=True)
         try:
-            cursor.execute(sql, values)
-            conn.commit()
+            if len(rows) > 1:
+                # Amortize per-row checks and log flushes across the batch
+                with bulk_mode(conn):
+                    bulk_insert(cursor, 'created_codes',
+                                ('type', 'data', 'image_path', 'date_created'),
+                                rows)
+                    conn.commit()
+            else:
+                # Single statement: the pooled connection autocommits, so an
+                # explicit COMMIT round-trip would be pure overhead
+                cursor.execute(_INSERT_META_SQL, rows[0])
             return True
         except mysql.connector.Error as err:
             messagebox.showerror("DB Error", f"Failed to save metadata: {err}")
@@ -235,48 +384,142 @@ def insert_code_metadata(type, data, image_path):
             conn.close()
 
 
+def queue_code_metadata(type, data, image_path):
+    """Queues metadata about a created code for the next batched insert."""
+    now = datetime.datetime.now()
+    metadata_data = data[:250]
+    _PENDING_META.append((type, metadata_data, image_path, now))
+
+
+def flush_pending_metadata():
+    """Writes all queued metadata rows in one batched INSERT."""
+    global _PENDING_META
+    if not _PENDING_META:
+        return True
+    rows = _PENDING_META
+    _PENDING_META = []
+    return insert_code_metadata(rows)
+
+
+# Byte-mode data capacity per QR version at error correction level M (the
+# qrcode default), used to pick the version directly instead of letting
+# fit=True re-encode the payload once per candidate version
+_QR_CAPACITY_M = (14, 26, 42, 62, 84, 106, 122, 152, 180, 213, 251, 287, 331, 362, 412)
+
+
+def _pick_qr_version(data_len):
+    """Returns the smallest QR version whose byte capacity fits data_len.
+
+    Returns None for payloads larger than version 15; the caller then falls
+    back to the library's auto-fit search.
+    """
+    for version, capacity in enumerate(_QR_CAPACITY_M, start=1):
+        if data_len <= capacity:
+            return version
+    return None
+
+
+def _make_qr_image(data):
+    """Builds the QR PIL image for `data` with a direct version lookup."""
+    version = _pick_qr_version(len(data.encode('utf-8')))
+    qr = qrcode.QRCode(version=version, box_size=10, border=4)
+    qr.add_data(data)
+    qr.make(fit=version is None)
+    return qr.make_image(fill_color="black", back_color="white").get_image()
+
+
+def _save_png(img, full_path):
+    """Writes a PIL image as PNG through a large buffered file handle.
+
+    Image writers emit many small write() calls; the 1 MB buffer collapses
+    them into a handful of syscalls. compress_level=1 trades slightly larger
+    files for ~3x less CPU than the default level 6, a good fit for
+    interactive code generation.
+    """
+    with open(full_path, 'wb', buffering=1 << 20) as f:
+        img.save(f, format='PNG', optimize=False, compress_level=1)
+
+
 def generate_qr(data, filename):
-    """Generates a QR code image, saves it, and records metadata."""
-    try:
-        qr = qrcode.QRCode(version=1, box_size=10, border=4)
-        qr.add_data(data)
-        qr.make(fit=True)
-        img = qr.make_image(fill_color="black", back_color="white")
+    """Generates a QR code image, records metadata, and saves it to disk.
 
-        full_path = os.path.join(CODES_DIR, f"{filename}_QR.png")
-        img.save(full_path)
+    Returns (pil_img, full_path). The in-memory image lets the caller show
+    a preview without re-opening and decoding the PNG from disk. Runs on a
+    worker thread, so errors propagate to the caller's done-callback for
+    display instead of touching Tk here; the save happens before metadata
+    is queued so a failed write never leaves a dangling DB row.
+    """
+    img = _make_qr_image(data)
 
-        insert_code_metadata('QR', data, full_path)
-        return full_path
-    except Exception as e:
-        messagebox.showerror("QR Error", f"Failed to generate QR code: {e}")
-        return None
+    full_path = os.path.join(CODES_DIR, f"{filename}_QR.png")
+    _save_png(img, full_path)
+
+    queue_code_metadata('QR', data, full_path)
+    return img, full_path
 
 
 def generate_barcode(data, filename):
-    """Generates a Code128 barcode image, saves it, and records metadata."""
-    try:
-        code128 = Code128(data, writer=ImageWriter())
-        full_path_base = os.path.join(CODES_DIR, f"{filename}_BAR")
+    """Generates a Code128 barcode image, records metadata, and saves it.
 
-        code128.save(full_path_base)
-        full_path = full_path_base + '.png'
+    Returns (pil_img, full_path), rendering the barcode in memory once,
+    like generate_qr. Also like generate_qr, errors propagate to the
+    caller's done-callback rather than raising a dialog off-thread.
+    """
+    code128 = Code128(data, writer=ImageWriter())
+    full_path_base = os.path.join(CODES_DIR, f"{filename}_BAR")
+    full_path = full_path_base + '.png'
+
+    if tksvg is not None:
+        # SVG generation is string concatenation, 10-30x cheaper than
+        # rasterizing; the PNG still renders here on the worker thread
+        buf = io.BytesIO()
+        Code128(data, writer=SVGWriter()).write(buf)
+        preview = buf.getvalue()
+        _save_png(code128.render(), full_path)
+    else:
+        preview = code128.render()
+        _save_png(preview, full_path)
 
-        insert_code_metadata('BAR', data, full_path)
-        return full_path
-    except Exception as e:
-        messagebox.showerror("Barcode Error",
-                             f"Failed to generate barcode: {e}\n(Note: Code128 requires alphanumeric data)")
-        return None
+    queue_code_metadata('BAR', data, full_path)
+    return preview, full_path
 
 
 # --- START OF LATEST FEATURE: UPDATE AND REGENERATE ---
 
-def update_code_and_regenerate(record_id, code_type, new_data, old_path):
+def _cached_code_path(code_type, data):
+    """Returns the content-addressed cache path for a (type, data) payload."""
+    digest = hashlib.sha1(f"{code_type}:{data}".encode()).hexdigest()
+    return os.path.join(CACHE_DIR, f"{digest}.png")
+
+
+def _materialize_code_image(code_type, data, full_path):
+    """Creates the image for (code_type, data) at full_path via the cache.
+
+    The PNG is generated at most once per payload; repeats hardlink the
+    cached file (falling back to a plain copy where links aren't supported).
+    """
+    cache_path = _cached_code_path(code_type, data)
+    if not os.path.exists(cache_path):
+        if code_type == 'QR':
+            _save_png(_make_qr_image(data), cache_path)
+        else:
+            _save_png(Code128(data, writer=ImageWriter()).render(), cache_path)
+
+    try:
+        os.link(cache_path, full_path)
+    except OSError:
+        shutil.copyfile(cache_path, full_path)
+
+
+def update_code_and_regenerate(record_id, code_type, new_data, old_path, old_data=None):
     """
     Updates the database record with new data and regenerates the code image,
     replacing the old file. This operation is designed to be atomic with respect to the DB.
     """
+    if old_data is not None and new_data == old_data:
+        # Resubmitted without changes: nothing to regenerate or update
+        return True, "No changes detected; record left as-is."
+
     conn = get_db_connection()
     if not conn:
         return False, "Cannot connect to database."
@@ -292,24 +535,15 @@ def update_code_and_regenerate(record_id, code_type, new_data, old_path):
         if os.path.exists(old_path):
             os.remove(old_path)
 
-        if code_type == 'QR':
-            qr = qrcode.QRCode(version=1, box_size=10, border=4)
-            qr.add_data(new_data)
-            qr.make(fit=True)
-            img = qr.make_image(fill_color="black", back_color="white")
-            img.save(full_path)
-
-        elif code_type == 'BAR':
+        if code_type == 'BAR':
             # Extract the base filename without the extension
             filename_base = os.path.splitext(os.path.basename(full_path))[0]
             base_path_no_ext = os.path.join(CODES_DIR, filename_base)
 
-            code128 = Code128(new_data, writer=ImageWriter())
-            code128.save(base_path_no_ext)  # This saves as base_path_no_ext.png
-
             # Update full_path in case Code128 writer logic slightly alters the name/extension
             full_path = base_path_no_ext + '.png'
-            # Ensure the newly created file name is consistent with what's stored/updated.
+
+        _materialize_code_image(code_type, new_data, full_path)
 
         # 2. Update the DB record
         metadata_data = new_data[:250]
@@ -328,13 +562,78 @@ def update_code_and_regenerate(record_id, code_type, new_data, old_path):
         conn.close()
 
 
+def update_many_codes(records):
+    """Bulk variant of update_code_and_regenerate.
+
+    `records` is a list of (record_id, code_type, new_data, image_path)
+    tuples. Images regenerate in parallel on a worker pool (encoding is
+    CPU-bound and independent per file), then all UPDATEs run as a single
+    executemany inside one transaction, so the per-record round-trip and
+    commit fsync are paid once for the whole batch.
+    """
+    conn = get_db_connection()
+    if not conn:
+        return False, "Cannot connect to database."
+
+    def regenerate(record):
+        _, code_type, new_data, image_path = record
+        if os.path.exists(image_path):
+            os.remove(image_path)
+        _materialize_code_image(code_type, new_data, image_path)
+
+    cursor = conn.cursor()
+    try:
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            list(executor.map(regenerate, records))
+
+        conn.start_transaction()
+        cursor.executemany(
+            "UPDATE created_codes SET data = %s WHERE id = %s",
+            [(record[2][:250], record[0]) for record in records])
+        conn.commit()
+        return True, f"{len(records)} records updated and regenerated."
+
+    except Exception as e:
+        conn.rollback()
+        return False, str(e)
+    finally:
+        cursor.close()
+        conn.close()
+
+
 # --- END OF LATEST FEATURE ---
 
 
+def copy_file_fast(source_path, dest_path):
+    """Copies a file using in-kernel sendfile where available.
+
+    sendfile moves the bytes without surfacing them in Python at all;
+    platforms or filesystems that refuse it fall back to shutil.copyfile,
+    which picks the fastest remaining path itself.
+    """
+    try:
+        with open(source_path, 'rb') as src, open(dest_path, 'wb') as dst:
+            size = os.fstat(src.fileno()).st_size
+            offset = 0
+            while offset < size:
+                sent = os.sendfile(dst.fileno(), src.fileno(), offset, 1 << 20)
+                if sent == 0:
+                    break
+                offset += sent
+    except (AttributeError, OSError):
+        shutil.copyfile(source_path, dest_path)
+
+
 # --- 3. PRINTER DETECTION AND PRINTING FUNCTIONS ---
 
+@functools.lru_cache(maxsize=1)
 def get_installed_printers():
-    """Returns a list of installed printer names based on OS."""
+    """Returns a list of installed printer names based on OS.
+
+    The result is cached because enumeration forks an lpstat subprocess (or
+    makes a Windows RPC call) each time; the Refresh Printers button clears
+    the cache via get_installed_printers.cache_clear().
+    """
     if sys.platform.startswith('win'):
         try:
             if 'win32print' in sys.modules:
@@ -411,13 +710,54 @@ class CodeManagerApp:
         self.notebook.add(self.tab_list, text='Manage Codes (View/Print/Export)')
         self.notebook.add(self.tab_crud, text='Edit/Delete Records')
 
+        self.tkimage = None
+
+        # Set once setup_database_tables succeeds so repeat clicks skip the
+        # CREATE DATABASE/TABLE parse + metadata lookups on the server
+        self._schema_ready = False
+
+        # Workers for code generation; PIL releases the GIL while encoding,
+        # so generation runs in parallel without freezing the event loop
+        self._gen_pool = ThreadPoolExecutor(max_workers=2)
+
+        # Workers for DB fetches: queries run off the main thread and the
+        # rows are marshalled back via master.after, since Tk widgets must
+        # only ever be touched from the main thread
+        self._db_pool = ThreadPoolExecutor(max_workers=2)
+
+        # LRU of view-window thumbnails keyed on (path, mtime); repeat views
+        # of the same code skip the decode + Lanczos resize entirely
+        self._thumb_cache = collections.OrderedDict()
+
+        # Image paths keyed by record id; keeping them out of the Treeview
+        # means Tcl never stores or copies the path string per row
+        self._paths_by_id = {}
+
+        # Row iid to re-select once the refresh after an update lands
+        self._reselect_id = None
+
+        # One fetch in flight per tree at most, to prevent refresh pile-ups;
+        # the generation counter discards results from superseded refreshes
+        self._list_fetch_inflight = False
+        self._list_gen = 0
+
         self.setup_tab_setup()
         self.setup_tab_create()
         self.setup_tab_list()
         self.setup_tab_crud()
 
-        self.tkimage = None
-        self.temp_tkimage = None
+        # Flush any queued code metadata when the user leaves the Create tab
+        self.notebook.bind('<<NotebookTabChanged>>', lambda event: flush_pending_metadata())
+
+        # Warm the connection pool off-thread so the first user action does
+        # not pay pool construction + TCP/auth handshake latency
+        self._db_pool.submit(self._warm_pool)
+
+    @staticmethod
+    def _warm_pool():
+        conn = get_db_connection()
+        if conn:
+            conn.close()
 
     # ----------------------------------------------------
     # --- SETUP TAB LAYOUT (Includes Delete Database) ---
@@ -479,6 +819,7 @@ class CodeManagerApp:
         save_config(new_settings)
         global DB_CONFIG
         DB_CONFIG = new_settings
+        self._schema_ready = False  # Config may point at a different server/DB
 
         temp_config = new_settings.copy()
         temp_config.pop('database', None)
@@ -494,11 +835,38 @@ class CodeManagerApp:
                                  f"Configuration saved, but connection test failed:\n{err}\n\nCheck your MySQL settings.")
 
     def handle_setup_db(self):
+        if self._schema_ready:
+            messagebox.showinfo("Success", f"Database '{DB_CONFIG['database']}' and tables are ready!")
+            return
+
         if setup_database_tables():
+            self._schema_ready = True
+            # Sessions pooled before the schema existed have no default
+            # database; start over with fresh connections
+            reset_connection_pool()
             messagebox.showinfo("Success", f"Database '{DB_CONFIG['database']}' and tables are ready!")
 
     def handle_backup_db(self):
-        backup_database()
+        proc, result, stderr_file = start_database_backup()
+        if proc is None:
+            messagebox.showerror("Backup Error", result)
+            return
+        self._poll_backup(proc, result, stderr_file)
+
+    def _poll_backup(self, proc, backup_file, stderr_file):
+        # Re-check from the event loop so a long dump never freezes the GUI
+        if proc.poll() is None:
+            self.master.after(200, self._poll_backup, proc, backup_file, stderr_file)
+            return
+
+        stderr_file.seek(0)
+        err_output = stderr_file.read().decode()
+        stderr_file.close()
+
+        if proc.returncode == 0:
+            messagebox.showinfo("Success", f"Database backed up successfully to: {backup_file}")
+        else:
+            messagebox.showerror("Backup Error", f"Error during backup: {err_output}")
 
     def handle_delete_db(self):
         db_name = DB_CONFIG['database']
@@ -523,12 +891,26 @@ class CodeManagerApp:
             # Use backticks for database name for safety
             cursor.execute(f"DROP DATABASE `{db_name}`")
             conn.commit()
+            self._schema_ready = False
+            # Pooled sessions still point at the dropped schema and would
+            # fail every query from here on; throw them away
+            reset_connection_pool()
 
             # Optional: Delete local files too
             try:
                 if os.path.exists(CODES_DIR):
-                    shutil.rmtree(CODES_DIR)
-                    os.makedirs(CODES_DIR)
+                    # Unlink files in place with parallel workers rather than
+                    # rmtree + makedirs; this overlaps the per-file syscalls
+                    # and keeps the directories themselves intact
+                    with ThreadPoolExecutor(max_workers=16) as executor:
+                        for folder in (CACHE_DIR, CODES_DIR):
+                            with os.scandir(folder) as entries:
+                                # Drain the result iterator so an unlink
+                                # failure (e.g. an in-use file on Windows)
+                                # re-raises here instead of being dropped
+                                list(executor.map(os.unlink,
+                                                  (entry.path for entry in entries
+                                                   if entry.is_file())))
                     file_msg = "\n(Associated local code files folder also reset.)"
                 else:
                     file_msg = ""
@@ -538,8 +920,7 @@ class CodeManagerApp:
             messagebox.showinfo("Success", f"Database '{db_name}' has been PERMANENTLY deleted." + file_msg)
 
             # Refresh lists if they are open
-            self.update_code_list()
-            self.update_crud_list()
+            self._reload_all_records()
 
         except mysql.connector.Error as err:
             messagebox.showerror("DB Deletion Error", f"Failed to delete database '{db_name}': {err}")
@@ -637,30 +1018,52 @@ class CodeManagerApp:
             data = format_wifi_payload(ssid, password, auth)
 
         # --- Generation Logic ---
+        # Generation runs on the worker pool; the result is marshalled back
+        # onto the Tk main thread via after() before touching any widgets
         if code_type.startswith('QR'):
-            path = generate_qr(data, filename)
+            future = self._gen_pool.submit(generate_qr, data, filename)
             code_name = "QR Code"
         elif code_type == 'BAR':
-            if not data.isalnum() and not all(c in ' -$./+%' for c in data):
+            if not _BAR_DATA_RE.match(data):
                 messagebox.showwarning("Barcode Error",
                                        "Barcode data should primarily contain numbers and basic alphanumeric characters.")
                 return
-            path = generate_barcode(data, filename)
+            future = self._gen_pool.submit(generate_barcode, data, filename)
             code_name = "Barcode"
         else:
-            path = None
+            return
+
+        future.add_done_callback(
+            lambda f: self.master.after(0, self._on_code_done, f, code_name))
+
+    def _on_code_done(self, future, code_name):
+        # Generation errors surface here, on the main thread, same as
+        # thumbnail failures in _on_thumb_loaded
+        try:
+            img, path = future.result()
+        except Exception as e:
+            if code_name == "Barcode":
+                messagebox.showerror("Barcode Error",
+                                     f"Failed to generate barcode: {e}\n(Note: Code128 requires alphanumeric data)")
+            else:
+                messagebox.showerror("QR Error", f"Failed to generate QR code: {e}")
+            return
 
         if path:
+            flush_pending_metadata()
             messagebox.showinfo("Success", f"{code_name} saved and recorded successfully.")
-            self.show_image_preview(path)
-            self.update_code_list()
-            self.update_crud_list()
+            self.show_image_preview(img)
+            self._reload_all_records()
 
-    def show_image_preview(self, path):
+    def show_image_preview(self, img):
+        # Preview straight from the in-memory image; no disk re-read
         try:
-            img = Image.open(path)
-            img = img.resize((200, 200), Image.LANCZOS)
-            self.tkimage = ImageTk.PhotoImage(img)
+            if isinstance(img, (bytes, str)):
+                # SVG barcode preview, scaled vector-side by tksvg
+                self.tkimage = tksvg.SvgImage(data=img, scaletoheight=200)
+            else:
+                img = img.resize((200, 200), Image.LANCZOS)
+                self.tkimage = ImageTk.PhotoImage(img)
             self.image_preview_label.config(image=self.tkimage, text="")
         except Exception:
             self.image_preview_label.config(image=None, text="Error loading image.")
@@ -669,33 +1072,42 @@ class CodeManagerApp:
     def setup_tab_list(self):
         ttk.Label(self.tab_list, text="List of Created Codes", font=('Arial', 14, 'bold')).pack(pady=10)
 
-        self.tree = ttk.Treeview(self.tab_list, columns=("ID", "Type", "Data", "Date Created", "Path"), show='headings')
+        # File paths live in self._paths_by_id rather than a hidden column,
+        # so Tcl never stores or marshals them per row
+        self.tree = ttk.Treeview(self.tab_list, columns=("ID", "Type", "Data", "Date Created"), show='headings')
         self.tree.heading("ID", text="ID")
         self.tree.heading("Type", text="Type")
         self.tree.heading("Data", text="Data")
         self.tree.heading("Date Created", text="Date Created")
-        self.tree.heading("Path", text="File Path (Hidden)", anchor='w')
 
         self.tree.column("ID", width=50, anchor='center')
         self.tree.column("Type", width=70, anchor='center')
         self.tree.column("Data", width=300)
         self.tree.column("Date Created", width=150)
-        self.tree.column("Path", width=0, stretch=tk.NO)
 
         self.tree.pack(fill='both', expand=True, padx=10)
 
+        # Load older pages lazily as the user scrolls to the bottom
+        for seq in ('<MouseWheel>', '<Button-4>', '<Button-5>',
+                    '<KeyRelease-Down>', '<KeyRelease-Next>', '<KeyRelease-End>'):
+            self.tree.bind(seq, self._on_record_scroll)
+
         # --- Printer Selection and Action Frame ---
-        print_frame = ttk.LabelFrame(self.tab_list, text=" Actions on Selected Code ")
+        self.print_frame = print_frame = ttk.LabelFrame(self.tab_list, text=" Actions on Selected Code ")
         print_frame.pack(pady=10, padx=10, fill='x')
 
-        printers = get_installed_printers()
-        self.printer_var = tk.StringVar(value=printers[0] if printers else "No Printers Found")
+        # Populated by a background scan so startup never blocks on the
+        # lpstat fork/exec (or the Windows spooler RPC)
+        self.printer_var = tk.StringVar(value="Detecting printers...")
 
         ttk.Label(print_frame, text="Select Printer:").grid(row=0, column=0, padx=5, pady=5, sticky='w')
-        self.printer_combo = ttk.Combobox(print_frame, textvariable=self.printer_var, values=printers, state='readonly',
+        self.printer_combo = ttk.Combobox(print_frame, textvariable=self.printer_var, values=[], state='readonly',
                                           width=30)
         self.printer_combo.grid(row=0, column=1, padx=5, pady=5, sticky='ew')
 
+        ttk.Button(print_frame, text="Refresh Printers", command=self.handle_refresh_printers).grid(row=0, column=2,
+                                                                                                    padx=5, pady=5)
+
         action_row = 1
         ttk.Button(print_frame, text="Refresh List", command=self.update_code_list).grid(row=action_row, column=0,
                                                                                          padx=5, pady=5, sticky='ew')
@@ -707,33 +1119,154 @@ class CodeManagerApp:
         ttk.Button(print_frame, text="Export Code Image", command=self.handle_export_image).grid(row=print_row,
                                                                                                  column=0, padx=5,
                                                                                                  pady=5, sticky='ew')
-        ttk.Button(print_frame,
-                   text="Print Selected Code",
-                   command=self.handle_print_selected_code).grid(row=print_row, column=1, padx=5, pady=5, sticky='ew')
+        self.print_btn = ttk.Button(print_frame,
+                                    text="Print Selected Code",
+                                    command=self.handle_print_selected_code)
+        self.print_btn.grid(row=print_row, column=1, padx=5, pady=5, sticky='ew')
+
+        # The first page load happens from setup_tab_crud, once both trees
+        # sharing the paged fetch exist
+        threading.Thread(target=self._scan_printers, daemon=True).start()
+
+    def handle_refresh_printers(self):
+        """Re-scans installed printers on explicit user request only."""
+        get_installed_printers.cache_clear()
+        threading.Thread(target=self._scan_printers, daemon=True).start()
+
+    def _scan_printers(self):
+        # Runs off-thread: the enumeration may fork lpstat or make an RPC call
+        printers = get_installed_printers()
+        self.master.after(0, self._set_printers, printers)
 
-        self.update_code_list()
+    def _set_printers(self, printers):
+        self.printer_combo.config(values=printers)
+        self.printer_var.set(printers[0] if printers else "No Printers Found")
 
     def update_code_list(self):
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        """Reloads both record views; older pages load on scroll."""
+        self._reload_all_records()
+
+    def _reload_all_records(self):
+        """Clears both trees and fetches the first shared page.
+
+        The list and CRUD views show the same projection of created_codes,
+        so one query per page feeds both instead of each tree paying its own
+        round-trip and row-conversion work.
+        """
+        # One delete call instead of one Tk layout pass per removed row
+        for tree in (self.tree, self.crud_tree):
+            children = tree.get_children()
+            if children:
+                tree.delete(*children)
+
+        self._paths_by_id.clear()
+        self._list_gen += 1
+        self._list_last_id = None
+        self._list_exhausted = False
+        self._load_more_records()
+
+    def _load_more_records(self):
+        """Requests the next shared page (keyset pagination on id DESC)."""
+        if self._list_exhausted or self._list_fetch_inflight:
+            return
+
+        self._list_fetch_inflight = True
+        self.crud_refresh_btn.config(state='disabled')
+        gen = self._list_gen
+        future = self._db_pool.submit(self._fetch_record_page, self._list_last_id)
+        future.add_done_callback(
+            lambda f: self.master.after(0, self._populate_record_page, f, gen))
 
+    def _fetch_record_page(self, last_id):
+        """Runs on a DB worker thread; fetches one page of records.
+
+        InnoDB's primary key covers ORDER BY id DESC, so each keyset page is
+        an index seek regardless of table size.
+        """
         conn = get_db_connection()
-        if conn:
-            cursor = conn.cursor()
-            sql = "SELECT id, type, data, date_created, image_path FROM created_codes ORDER BY date_created DESC"
-            try:
-                cursor.execute(sql)
-                records = cursor.fetchall()
+        if not conn:
+            return []
 
-                for rec in records:
-                    date_str = rec[3].strftime("%Y-%m-%d %H:%M:%S")
-                    self.tree.insert('', 'end', values=(rec[0], rec[1], rec[2], date_str, rec[4]))
+        # Unbuffered cursor streams rows instead of materializing them all
+        cursor = conn.cursor(buffered=False)
+        try:
+            # DATE_FORMAT ships the timestamp pre-formatted, removing the
+            # per-row strftime from the populate loop (%% escapes the format
+            # specifiers from the connector's own %s substitution)
+            if last_id is None:
+                sql = """SELECT id, type, data,
+                                DATE_FORMAT(date_created, '%%Y-%%m-%%d %%H:%%i:%%s'),
+                                image_path
+                         FROM created_codes
+                         ORDER BY id DESC LIMIT %s"""
+                cursor.execute(sql, (LIST_PAGE_SIZE,))
+            else:
+                sql = """SELECT id, type, data,
+                                DATE_FORMAT(date_created, '%%Y-%%m-%%d %%H:%%i:%%s'),
+                                image_path
+                         FROM created_codes
+                         WHERE id < %s
+                         ORDER BY id DESC LIMIT %s"""
+                cursor.execute(sql, (last_id, LIST_PAGE_SIZE))
+
+            return cursor.fetchmany(LIST_PAGE_SIZE)
+        finally:
+            cursor.close()
+            conn.close()
 
-            except mysql.connector.Error as err:
-                messagebox.showerror("DB Error", f"Failed to load records: {err}")
-            finally:
-                cursor.close()
-                conn.close()
+    def _populate_record_page(self, future, gen):
+        """Runs on the main thread; inserts a fetched page into both trees."""
+        self._list_fetch_inflight = False
+        self.crud_refresh_btn.config(state='normal')
+
+        if gen != self._list_gen:
+            # A newer refresh superseded this page; fetch it instead
+            self._load_more_records()
+            return
+
+        try:
+            records = future.result()
+        except mysql.connector.Error as err:
+            messagebox.showerror("DB Error", f"Failed to load records: {err}")
+            return
+
+        for rec in records:
+            self._paths_by_id[rec[0]] = rec[4]
+
+        self._fill_tree(self.tree, records,
+                        dict(fill='both', expand=True, padx=10, before=self.print_frame))
+        self._fill_tree(self.crud_tree, records,
+                        dict(fill='x', padx=10, before=self.crud_refresh_btn))
+
+        if records:
+            self._list_last_id = records[-1][0]
+        if len(records) < LIST_PAGE_SIZE:
+            self._list_exhausted = True
+
+        # Restore the selection from before an update, without scanning rows
+        if self._reselect_id is not None and self.crud_tree.exists(self._reselect_id):
+            self.crud_tree.selection_set(self._reselect_id)
+            self.crud_tree.focus(self._reselect_id)
+            self._reselect_id = None
+
+    @staticmethod
+    def _fill_tree(tree, rows, repack):
+        # Rows arrive pre-formatted; unmap the widget during the batch insert
+        # so the whole page costs one reflow. The path (row[4]) stays out of
+        # Tcl entirely, and the record id doubles as the iid so handlers can
+        # read the key straight from focus()
+        tree.pack_forget()
+        for row in rows:
+            tree.insert('', 'end', iid=str(row[0]), values=row[:4])
+        tree.pack(**repack)
+
+    def _on_record_scroll(self, event):
+        # yview updates after the event fires, so check from the event loop
+        self.master.after_idle(self._maybe_load_more_records, event.widget)
+
+    def _maybe_load_more_records(self, tree):
+        if tree.yview()[1] >= 1.0:
+            self._load_more_records()
 
     def handle_view_image(self):
         selected_item = self.tree.focus()
@@ -741,27 +1274,60 @@ class CodeManagerApp:
             messagebox.showwarning("Selection Error", "Please select a code from the list to view its image.")
             return
 
+        # The iid is the record id, so the path lookup needs no item() call
         item_values = self.tree.item(selected_item, 'values')
-        image_path = item_values[4]
+        image_path = self._paths_by_id[int(selected_item)]
 
-        if os.path.exists(image_path):
-            try:
-                img_window = tk.Toplevel(self.master)
-                img_window.title(f"Code Image: ID {item_values[0]}")
+        if not os.path.exists(image_path):
+            messagebox.showerror("File Error", f"Image file not found at path:\n{image_path}")
+            return
 
-                img = Image.open(image_path)
-                img = img.resize((300, 300), Image.LANCZOS)
+        key = (image_path, os.path.getmtime(image_path))
+        photo = self._thumb_cache.get(key)
+        if photo is not None:
+            self._thumb_cache.move_to_end(key)
+            self._show_view_window(photo, item_values)
+            return
 
-                self.temp_tkimage = ImageTk.PhotoImage(img)
+        # Decode + downscale on a worker so the event loop stays responsive;
+        # only the PhotoImage construction must happen on the main thread
+        future = self._gen_pool.submit(self._load_thumb, image_path)
+        future.add_done_callback(
+            lambda f: self.master.after(0, self._on_thumb_loaded, f, key, item_values))
+
+    @staticmethod
+    def _load_thumb(path):
+        img = Image.open(path)
+        # draft() lets libjpeg decode at a reduced DCT scale (a no-op for
+        # PNG), and thumbnail() runs its Lanczos pass on the already-small
+        # buffer while keeping the aspect ratio
+        img.draft('RGB', (300, 300))
+        img.thumbnail((300, 300), Image.LANCZOS)
+        return img
+
+    def _on_thumb_loaded(self, future, key, item_values):
+        try:
+            img = future.result()
+        except Exception as e:
+            messagebox.showerror("Image Load Error", f"Failed to load image from disk:\n{e}")
+            return
 
-                ttk.Label(img_window, image=self.temp_tkimage).pack(padx=10, pady=10)
-                ttk.Label(img_window, text=f"Data: {item_values[2]}", font=('Arial', 10, 'bold')).pack(pady=5)
-                ttk.Label(img_window, text=f"Type: {item_values[1]}").pack(pady=2)
+        photo = ImageTk.PhotoImage(img)
+        self._thumb_cache[key] = photo
+        if len(self._thumb_cache) > 64:
+            self._thumb_cache.popitem(last=False)
 
-            except Exception as e:
-                messagebox.showerror("Image Load Error", f"Failed to load image from disk:\n{e}")
-        else:
-            messagebox.showerror("File Error", f"Image file not found at path:\n{image_path}")
+        self._show_view_window(photo, item_values)
+
+    def _show_view_window(self, photo, item_values):
+        img_window = tk.Toplevel(self.master)
+        img_window.title(f"Code Image: ID {item_values[0]}")
+
+        # The cache keeps the PhotoImage alive, so the same uploaded
+        # pixmap can back any number of open view windows at once
+        ttk.Label(img_window, image=photo).pack(padx=10, pady=10)
+        ttk.Label(img_window, text=f"Data: {item_values[2]}", font=('Arial', 10, 'bold')).pack(pady=5)
+        ttk.Label(img_window, text=f"Type: {item_values[1]}").pack(pady=2)
 
     def handle_export_image(self):
         selected_item = self.tree.focus()
@@ -769,8 +1335,7 @@ class CodeManagerApp:
             messagebox.showwarning("Selection Error", "Please select a code from the list to export its image.")
             return
 
-        item_values = self.tree.item(selected_item, 'values')
-        source_path = item_values[4]
+        source_path = self._paths_by_id[int(selected_item)]
 
         if not os.path.exists(source_path):
             messagebox.showerror("File Error", f"Image file not found at path:\n{source_path}")
@@ -782,7 +1347,7 @@ class CodeManagerApp:
 
         # Ask user for save location and filename
         # Suggest a filename based on the ID and original name
-        suggested_name = f"Code_{item_values[0]}_{name}"
+        suggested_name = f"Code_{selected_item}_{name}"
 
         save_path = filedialog.asksaveasfilename(
             defaultextension=ext,
@@ -793,7 +1358,7 @@ class CodeManagerApp:
 
         if save_path:
             try:
-                shutil.copyfile(source_path, save_path)
+                copy_file_fast(source_path, save_path)
                 messagebox.showinfo("Export Success", f"Image successfully exported to:\n{save_path}")
             except Exception as e:
                 messagebox.showerror("Export Failed", f"Could not export file:\n{e}")
@@ -804,20 +1369,31 @@ class CodeManagerApp:
             messagebox.showwarning("Selection Error", "Please select a code from the list to print.")
             return
 
-        item_values = self.tree.item(selected_item, 'values')
-        image_path = item_values[4]
+        image_path = self._paths_by_id[int(selected_item)]
         printer_name = self.printer_var.get()
 
         if not os.path.exists(image_path):
             messagebox.showerror("File Error", f"Image file not found at path:\n{image_path}")
             return
 
-        if not printer_name or printer_name == "No Printers Found":
+        # The scan placeholder is not a real queue name; printing against it
+        # would hand "Detecting printers..." to lpr/the spooler
+        if not printer_name or printer_name in ("No Printers Found", "Detecting printers..."):
             messagebox.showwarning("Printer Error",
                                    "No printer is selected or detected. Please check your system settings.")
             return
 
+        # Spooler APIs can block for seconds while a driver initializes, so
+        # hand the job to a worker and report back on the main thread
+        self.print_btn.config(state='disabled')
+        threading.Thread(target=self._do_print, args=(image_path, printer_name), daemon=True).start()
+
+    def _do_print(self, image_path, printer_name):
         success, message = print_file_os(image_path, printer_name)
+        self.master.after(0, self._on_print_done, success, message)
+
+    def _on_print_done(self, success, message):
+        self.print_btn.config(state='normal')
 
         if success:
             messagebox.showinfo("Printing Success", f"Successfully sent file to printer.\n{message}")
@@ -830,26 +1406,30 @@ class CodeManagerApp:
         ttk.Label(self.tab_crud, text="Edit or Delete Existing Codes", font=('Arial', 14, 'bold')).pack(pady=10)
 
         # Ensure column settings are consistent with the list view
-        self.crud_tree = ttk.Treeview(self.tab_crud, columns=("ID", "Type", "Data", "Date Created", "Path"),
+        self.crud_tree = ttk.Treeview(self.tab_crud, columns=("ID", "Type", "Data", "Date Created"),
                                       show='headings')
         self.crud_tree.heading("ID", text="ID")
         self.crud_tree.heading("Type", text="Type")
         self.crud_tree.heading("Data", text="Data")
         self.crud_tree.heading("Date Created", text="Date Created")
-        self.crud_tree.heading("Path", text="File Path (Hidden)", anchor='w')
 
         self.crud_tree.column("ID", width=50, anchor='center')
         self.crud_tree.column("Type", width=70, anchor='center')
         self.crud_tree.column("Data", width=250)
         self.crud_tree.column("Date Created", width=150)
-        self.crud_tree.column("Path", width=0, stretch=tk.NO)
 
         self.crud_tree.pack(fill='x', padx=10)
 
         # Binding the selection event to load data for edit/delete
         self.crud_tree.bind('<<TreeviewSelect>>', self.load_selected_record)
 
-        ttk.Button(self.tab_crud, text="Refresh Records", command=self.update_crud_list).pack(pady=5)
+        # Load older pages lazily as the user scrolls to the bottom
+        for seq in ('<MouseWheel>', '<Button-4>', '<Button-5>',
+                    '<KeyRelease-Down>', '<KeyRelease-Next>', '<KeyRelease-End>'):
+            self.crud_tree.bind(seq, self._on_record_scroll)
+
+        self.crud_refresh_btn = ttk.Button(self.tab_crud, text="Refresh Records", command=self.update_crud_list)
+        self.crud_refresh_btn.pack(pady=5)
 
         ttk.Separator(self.tab_crud, orient='horizontal').pack(fill='x', padx=20, pady=10)
 
@@ -879,28 +1459,8 @@ class CodeManagerApp:
         self.update_crud_list()
 
     def update_crud_list(self):
-        for item in self.crud_tree.get_children():
-            self.crud_tree.delete(item)
-
-        conn = get_db_connection()
-        if conn:
-            cursor = conn.cursor()
-            sql = "SELECT id, type, data, date_created, image_path FROM created_codes ORDER BY id DESC"
-            try:
-                cursor.execute(sql)
-                records = cursor.fetchall()
-
-                for rec in records:
-                    date_str = rec[3].strftime("%Y-%m-%d %H:%M:%S")
-                    self.crud_tree.insert('', 'end', values=(rec[0], rec[1], rec[2], date_str, rec[4]))
-
-            except mysql.connector.Error as err:
-                messagebox.showerror("DB Error", f"Failed to load records for CRUD: {err}")
-            finally:
-                cursor.close()
-                conn.close()
-
-        self.update_code_list()
+        """Reloads both record views; older pages load on scroll."""
+        self._reload_all_records()
 
     def load_selected_record(self, event):
         selected_item = self.crud_tree.focus()
@@ -909,7 +1469,7 @@ class CodeManagerApp:
 
         values = self.crud_tree.item(selected_item, 'values')
 
-        self.crud_id.config(text=values[0])
+        self.crud_id.config(text=selected_item)
         self.crud_type.config(text=values[1])
 
         self.crud_data_entry.delete(0, tk.END)
@@ -917,43 +1477,45 @@ class CodeManagerApp:
 
     # MODIFIED: Includes call to update_code_and_regenerate (the latest feature)
     def handle_update_record(self):
-        record_id = self.crud_id.cget("text")
-        code_type = self.crud_type.cget("text")
-        new_data = self.crud_data_entry.get().strip()
-
-        if not record_id:
+        # Read the selection once up front; focus(), item() and cget() each
+        # cross the Python<->Tcl boundary
+        selected_item = self.crud_tree.focus()
+        if not selected_item:
             messagebox.showwarning("Input Error", "Please select a record using the list above.")
             return
 
+        # The iid is the record id; item() is only needed for type/old data
+        record_id = selected_item
+        item_values = self.crud_tree.item(selected_item, 'values')
+        code_type = item_values[1]
+        old_path = self._paths_by_id[int(record_id)]
+        new_data = self.crud_data_entry.get().strip()
+
         if not new_data:
             messagebox.showwarning("Input Error", "New Data field cannot be empty.")
             return
 
-        # Get the current image path from the Treeview selection
-        selected_item = self.crud_tree.focus()
-        if not selected_item:
-            messagebox.showwarning("Selection Error", "Please re-select a record to perform the update.")
-            return
-
-        # Values are (ID, Type, Data, Date Created, Path)
-        item_values = self.crud_tree.item(selected_item, 'values')
-        old_path = item_values[4]
-
         # Barcode validation check for Code128 (BAR) type
         if code_type == 'BAR':
             # Check for non-alphanumeric/non-standard chars only if the type is BAR
-            if not new_data.isalnum() and not all(c in ' -$./+%' for c in new_data):
+            if not _BAR_DATA_RE.match(new_data):
                 messagebox.showwarning("Barcode Error",
                                        "Barcode data should primarily contain numbers and basic alphanumeric characters.")
                 return
 
         try:
             # Call the new feature function to update DB and regenerate image
-            success, result_msg = update_code_and_regenerate(record_id, code_type, new_data, old_path)
+            success, result_msg = update_code_and_regenerate(record_id, code_type, new_data, old_path,
+                                                             old_data=item_values[2])
 
             if success:
-                messagebox.showinfo("Success", f"Record ID {record_id} updated and image regenerated successfully!")
-                self.update_crud_list()
+                # The message distinguishes a real regeneration from the
+                # no-change early-out, which also needs no refresh
+                messagebox.showinfo("Success", f"Record ID {record_id}: {result_msg}")
+                if new_data != item_values[2]:
+                    # O(1) re-select by iid once the refreshed page arrives
+                    self._reselect_id = str(record_id)
+                    self.update_crud_list()
             else:
                 # Should not be reached if exception is raised, but as a safeguard
                 messagebox.showerror("Update Failed", f"Update failed. Error: {result_msg}")
@@ -962,43 +1524,67 @@ class CodeManagerApp:
             messagebox.showerror("Update/Regen Failed", f"An error occurred during update and regeneration: {e}")
 
     def handle_delete_record(self):
-        record_id = self.crud_id.cget("text")
-
-        if not record_id:
+        # The focused iid is the record id, so one focus() call covers it all
+        selected_item = self.crud_tree.focus()
+        if not selected_item:
             messagebox.showwarning("Input Error", "Please select a record to delete.")
             return
 
+        record_id = selected_item
+        image_path = self._paths_by_id[int(record_id)]
+
         if not messagebox.askyesno("Confirm Delete",
                                    f"Are you sure you want to permanently delete Record ID {record_id}?"):
             return
 
-        selected_item = self.crud_tree.focus()
-        image_path = self.crud_tree.item(selected_item, 'values')[4] if selected_item else None
+        # DELETE round-trip and file unlink both run on the DB pool; only the
+        # result dialog touches the UI thread
+        future = self._db_pool.submit(self._delete_record_worker, record_id, image_path)
+        future.add_done_callback(
+            lambda f: self.master.after(0, self._on_delete_done, f, record_id))
 
+    @staticmethod
+    def _delete_record_worker(record_id, image_path):
+        """Deletes the record and its image file. Returns (file_deleted, err)."""
         conn = get_db_connection()
-        if conn:
-            cursor = conn.cursor()
-            sql = "DELETE FROM created_codes WHERE id = %s"
-            try:
-                cursor.execute(sql, (record_id,))
-                conn.commit()
-
-                file_msg = ""
-                if image_path and os.path.exists(image_path):
-                    os.remove(image_path)
-                    file_msg = "\n(Associated file deleted.)"
-
-                messagebox.showinfo("Success", f"Record ID {record_id} deleted successfully!" + file_msg)
-                self.update_crud_list()
-                self.crud_id.config(text="")
-                self.crud_type.config(text="")
-                self.crud_data_entry.delete(0, tk.END)
-
-            except mysql.connector.Error as err:
-                messagebox.showerror("DB Error", f"Failed to delete record: {err}")
-            finally:
-                cursor.close()
-                conn.close()
+        if not conn:
+            return False, "Cannot connect to database. Check configuration."
+
+        cursor = conn.cursor()
+        try:
+            # Explicit transaction: one commit (and one fsync) for the
+            # whole delete, with a clean rollback on failure
+            conn.start_transaction()
+            cursor.execute("DELETE FROM created_codes WHERE id = %s", (record_id,))
+            conn.commit()
+        except mysql.connector.Error as err:
+            conn.rollback()
+            return False, str(err)
+        finally:
+            cursor.close()
+            conn.close()
+
+        file_deleted = False
+        if image_path:
+            # Unconditional remove with suppress saves the extra stat() that
+            # os.path.exists would cost (noticeable on networked filesystems)
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(image_path)
+                file_deleted = True
+        return file_deleted, None
+
+    def _on_delete_done(self, future, record_id):
+        file_deleted, err = future.result()
+        if err:
+            messagebox.showerror("DB Error", f"Failed to delete record: {err}")
+            return
+
+        file_msg = "\n(Associated file deleted.)" if file_deleted else ""
+        messagebox.showinfo("Success", f"Record ID {record_id} deleted successfully!" + file_msg)
+        self.update_crud_list()
+        self.crud_id.config(text="")
+        self.crud_type.config(text="")
+        self.crud_data_entry.delete(0, tk.END)
 
 
 if __name__ == '__main__':